@@ -36,17 +36,24 @@ class FutureRow:
 # Core logic
 # =========================
 
+# Dispatch résolu une fois par courbe au lieu de 2 comparaisons
+# de strings par ligne
+_FORMULAS = {
+    "100_minus_rate": lambda p: 100.0 - float(p),
+    "rate_direct": float,
+}
+
+
 def implied_rate_from_price(price: float, price_formula: str) -> float:
     """
     Convertit un prix future en taux implicite.
     - "100_minus_rate" : implied = 100 - price
     - "rate_direct"    : implied = price
     """
-    if price_formula == "100_minus_rate":
-        return 100.0 - float(price)
-    if price_formula == "rate_direct":
-        return float(price)
-    raise ValueError(f"Unknown price_formula: {price_formula}")
+    fn = _FORMULAS.get(price_formula)
+    if fn is None:
+        raise ValueError(f"Unknown price_formula: {price_formula}")
+    return fn(price)
 
 
 def assess_quality(
@@ -101,6 +108,10 @@ def compute_implied_curve_from_rows(
     futures_cfg = config.get("futures", {})
     price_formula = futures_cfg.get("price_formula", "100_minus_rate")
 
+    formula_fn = _FORMULAS.get(price_formula)
+    if formula_fn is None:
+        raise ValueError(f"Unknown price_formula: {price_formula}")
+
     thresholds = config.get(
         "data_quality_thresholds",
         {
@@ -118,7 +129,7 @@ def compute_implied_curve_from_rows(
         if price is None:
             continue  # sécurité
 
-        implied = implied_rate_from_price(price, price_formula)
+        implied = formula_fn(price)
         q = assess_quality(r, thresholds, ignore_missing_spread=ignore_missing_spread)
 
         out.append({
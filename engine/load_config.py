@@ -1,15 +1,46 @@
-import yaml
+import json
+from functools import lru_cache
 from pathlib import Path
 
+import yaml
+
+# Loader C (libyaml) si dispo, sinon loader pur Python
+try:
+    _YAML_LOADER = yaml.CSafeLoader
+except AttributeError:
+    _YAML_LOADER = yaml.SafeLoader
+
+
+@lru_cache(maxsize=None)
 def load_config(bank_code: str):
     """
     Load a central bank YAML config from /configs
     Example: bank_code="FED" -> configs/fed.yaml
+
+    The YAML stays the source of truth; a .json sidecar is written at
+    first load and reused while it is at least as recent as the YAML
+    (json.loads being much faster than a YAML parse). Cached per run
+    via lru_cache.
     """
     config_path = Path("configs") / f"{bank_code.lower()}.yaml"
 
     if not config_path.exists():
         raise FileNotFoundError(f"Config not found: {config_path}")
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    json_path = config_path.with_suffix(".json")
+    try:
+        if json_path.stat().st_mtime >= config_path.stat().st_mtime:
+            return json.loads(json_path.read_bytes())
+    except (OSError, ValueError):
+        pass  # sidecar absent ou illisible -> reparse le YAML
+
+    cfg = yaml.load(config_path.read_text(encoding="utf-8"), Loader=_YAML_LOADER)
+
+    try:
+        json_path.write_text(json.dumps(cfg), encoding="utf-8")
+    except (OSError, TypeError):
+        # filesystem read-only, ou valeur YAML non JSON (ex: une date
+        # ISO non quotée): pas de sidecar, on garde juste le cache mémoire
+        pass
+
+    return cfg
@@ -3,13 +3,34 @@
 from __future__ import annotations
 
 import csv
+import hashlib
 import json
-import calendar
+import os
+import re
+import sys
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as papq
+
+# orjson optionnel: ~5-10x plus rapide, mais le moteur doit tourner
+# sur stdlib seule si besoin
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .load_config import load_config
-from .meeting_expected import compute_after_meeting_curve
+from .meeting_expected import _days_in_month
 
 
 # -------------------------------------------------
@@ -18,6 +39,7 @@ from .meeting_expected import compute_after_meeting_curve
 
 CSV_PATH = Path("data/futures/watchlist.csv")
 OUT_DIR = Path("data/output")
+CACHE_DIR = Path("data/cache")
 
 NAME_FILTERS = {
     "FED": ["30-Day Fed Funds"],
@@ -25,12 +47,40 @@ NAME_FILTERS = {
     "ECB": ["3-Month Euribor"],  # ✅ Euribor ONLY
 }
 
+# Un seul pattern (alternation) par banque, compilé à l'import,
+# au lieu de lower() + any(substring) par ligne à chaque appel
+NAME_PATTERNS = {
+    bank: "|".join(re.escape(f) for f in fs)
+    for bank, fs in NAME_FILTERS.items()
+}
+
+# Pattern combiné (groupes nommés) pour classer chaque ligne dans sa
+# banque en UNE passe sur la colonne Name, au lieu d'un scan par banque
+_COMBINED_NAME_PATTERN = "(?i)" + "|".join(
+    f"(?P<{bank}>(?:{pattern}))" for bank, pattern in NAME_PATTERNS.items()
+)
+
 MONTH_CODE = {
     "F": 1, "G": 2, "H": 3, "J": 4,
     "K": 5, "M": 6, "N": 7, "Q": 8,
     "U": 9, "V": 10, "X": 11, "Z": 12,
 }
 
+# LUT codepoint -> mois (0 = lettre inconnue) pour le décodage
+# scalaire (bytes, zéro boxing)
+_MONTH_LUT_BYTES = bytearray(128)
+for _ch, _m in MONTH_CODE.items():
+    _MONTH_LUT_BYTES[ord(_ch)] = _m
+_MONTH_LUT_BYTES = bytes(_MONTH_LUT_BYTES)
+
+# Mois préformatés: évite le f-string "{month:02d}" par symbole
+_MM_STRS = ("", "01", "02", "03", "04", "05", "06",
+            "07", "08", "09", "10", "11", "12")
+
+# "YYYY-MM" internés: ~12 valeurs distinctes par année seulement,
+# les dicts indexés par mois comparent alors par identité
+_YM_CACHE: dict[int, str] = {}
+
 
 # -------------------------------------------------
 # HELPERS
@@ -53,103 +103,399 @@ def index_to_month(idx: int) -> str:
     return f"{y:04d}-{m:02d}"
 
 
+def months_to_indices(months: np.ndarray) -> np.ndarray:
+    """
+    Version vectorisée de month_to_index sur toute une colonne "YYYY-MM":
+    vue int32 sur le buffer unicode + arithmétique sur les digits,
+    au lieu d'un int(slice) Python par valeur.
+    """
+    n = len(months)
+    if n == 0:
+        return np.zeros(0, dtype=np.int32)
+    width = months.dtype.itemsize // 4
+    d = months.view(np.int32).reshape(n, width) - 48
+    y = d[:, 0] * 1000 + d[:, 1] * 100 + d[:, 2] * 10 + d[:, 3]
+    return y * 12 + (d[:, 5] * 10 + d[:, 6]) - 1
+
+
+@lru_cache(maxsize=8192)
 def parse_month_from_symbol(symbol: str) -> str | None:
     symbol = symbol.strip().upper()
     if len(symbol) < 4:
         return None
 
-    month_letter = symbol[-3]
-    yy = symbol[-2:]
+    # Décodage table-driven: LUT + arithmétique sur les codepoints,
+    # au lieu de dict lookup + isdigit + int()
+    letter = ord(symbol[-3])
+    month = _MONTH_LUT_BYTES[letter] if letter < 128 else 0
+    d1 = ord(symbol[-2]) - 48
+    d0 = ord(symbol[-1]) - 48
 
-    if month_letter not in MONTH_CODE or not yy.isdigit():
+    if month == 0 or d1 < 0 or d1 > 9 or d0 < 0 or d0 > 9:
         return None
 
-    year = 2000 + int(yy)
-    month = MONTH_CODE[month_letter]
-    return f"{year:04d}-{month:02d}"
+    key = (d1 * 10 + d0) * 12 + month
+    ym = _YM_CACHE.get(key)
+    if ym is None:
+        # 2000..2099: str() donne toujours 4 chiffres, pas besoin de :04d
+        ym = sys.intern(str(2000 + d1 * 10 + d0) + "-" + _MM_STRS[month])
+        _YM_CACHE[key] = ym
+    return ym
+
+
+# Lettres dans l'ordre des mois (F=1 ... Z=12) + mois préformatés,
+# pour le décodage Arrow (index_in + take)
+_MONTH_LETTERS_PA = pa.array(list(MONTH_CODE))
+_MONTH_STRS_PA = pa.array([f"{m:02d}" for m in range(1, 13)])
+
+
+def parse_months_arrow(symbols: pa.ChunkedArray | pa.Array) -> pa.Array:
+    """
+    Version vectorisée de parse_month_from_symbol sur toute la colonne:
+    slice des codeunits, index_in sur les lettres de mois et join
+    "YYYY-MM", le tout en kernels C sans repasser par des objets Python.
+    """
+    s = pc.utf8_upper(pc.utf8_trim_whitespace(symbols))
+    letters = pc.utf8_slice_codeunits(s, start=-3, stop=-2)
+    yy = pc.utf8_slice_codeunits(s, start=-2, stop=1 << 30)
+
+    idx = pc.index_in(letters, value_set=_MONTH_LETTERS_PA)
+    ok = pc.and_kleene(pc.is_valid(idx), pc.match_substring_regex(yy, r"^\d\d$"))
+    ok = pc.and_kleene(ok, pc.greater_equal(pc.utf8_length(s), 4))
+    ok = pc.fill_null(ok, False)
+
+    year = pc.add(pc.cast(pc.if_else(ok, yy, "00"), pa.int32()), 2000)
+    months = pc.binary_join_element_wise(
+        pc.cast(year, pa.string()),
+        pc.take(_MONTH_STRS_PA, pc.fill_null(idx, 0)),
+        "-",
+    )
+    return pc.if_else(ok, months, "")
 
 
 def to_float(x: str) -> float | None:
+    # Pré-filtre sur le 1er caractère: les cellules vides / "N/A"
+    # sortent sans payer le coût d'une exception
+    x = x.strip() if x else ""
+    if not x or x[0] not in "0123456789-+.":
+        return None
     try:
-        return float(x.strip())
-    except:
+        return float(x)
+    except ValueError:
         return None
 
 
 def to_int(x: str) -> int | None:
+    x = x.strip() if x else ""
+    if not x or x[0] not in "0123456789-+.":
+        return None
     try:
-        return int(float(x.strip()))
-    except:
+        # pas de round-trip par float() pour les entiers simples
+        return int(x)
+    except ValueError:
+        pass
+    try:
+        # "123.0", "1e3", ... — OverflowError: int(inf) sur "9.9e999"
+        return int(float(x))
+    except (ValueError, OverflowError):
         return None
 
 
-def implied_rate_from_price(price: float, formula: str) -> float:
-    if formula == "100_minus_rate":
-        return 100.0 - float(price)
-    if formula == "rate_direct":
-        return float(price)
-    raise ValueError("Unknown price_formula")
-
-
 # -------------------------------------------------
 # CSV LOADING
 # -------------------------------------------------
 
-def load_csv_rows(csv_path: Path) -> list[dict]:
+@dataclass
+class FuturesTable:
+    """
+    Layout SoA (une colonne = un array) du CSV normalisé.
+    Évite un dict Python par ligne à chaque étape du pipeline;
+    les dicts ne sont matérialisés qu'au moment du JSON final.
+    """
+    symbols: np.ndarray   # U  ("ZQG26")
+    names: np.ndarray     # U  ("30-Day Fed Funds")
+    months: np.ndarray    # U7 ("2026-02")
+    prices: np.ndarray    # float64
+    volumes: np.ndarray   # int64
+    # Colonne Name au format Arrow, construite une fois au chargement
+    # et partagée par les filtres des 3 banques
+    names_arrow: pa.Array | None = None
+    # Mois en indices entiers (y*12 + m-1): tris/comparaisons int au
+    # lieu de strings U7; la string ne sert qu'à la frontière JSON
+    month_idx: np.ndarray | None = None
+
+    def __post_init__(self):
+        if self.month_idx is None:
+            self.month_idx = months_to_indices(self.months)
+
+
+class Row(NamedTuple):
+    """Ligne normalisée du fallback pur Python (~80B vs ~230B en dict)."""
+    symbol: str
+    name: str
+    month: str
+    price: float
+    volume: int
+
+
+def _table_from_rows(rows: list[Row]) -> FuturesTable:
+    names = [r.name for r in rows]
+    return FuturesTable(
+        symbols=np.asarray([r.symbol for r in rows], dtype=str),
+        names=np.asarray(names, dtype=str),
+        months=np.asarray([r.month for r in rows], dtype=str),
+        prices=np.asarray([r.price for r in rows], dtype=np.float64),
+        volumes=np.asarray([r.volume for r in rows], dtype=np.int64),
+        names_arrow=pa.array(names, type=pa.string()),
+    )
+
+
+def _load_csv_rows_python(csv_path: Path) -> list[Row]:
+    """
+    Fallback lent (cellule par cellule) si le CSV est trop malformé
+    pour le reader Arrow. Garde to_float/to_int pour les cellules sales.
+    """
     rows = []
-    with csv_path.open("r", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        for r in reader:
-            symbol = (r.get("Symbol") or "").strip()
-            name = (r.get("Name") or "").strip()
-            latest = to_float(r.get("Latest") or "")
-            volume = to_int(r.get("Volume") or "") or 0
+    # Gros buffer (1 MiB) + csv.reader positionnel: pas de dict par
+    # ligne ni de mapping header refait à chaque row par DictReader
+    with csv_path.open(
+        "r", encoding="utf-8-sig", newline="", buffering=1 << 20
+    ) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return rows
+
+        try:
+            i_sym = header.index("Symbol")
+            i_name = header.index("Name")
+            i_latest = header.index("Latest")
+            i_vol = header.index("Volume")
+        except ValueError:
+            return rows
+        width = max(i_sym, i_name, i_latest, i_vol) + 1
+
+        for rec in reader:
+            if len(rec) < width:
+                continue  # ligne courte (footer Barchart)
+
+            symbol = sys.intern(rec[i_sym].strip())
+            latest = to_float(rec[i_latest])
 
             month = parse_month_from_symbol(symbol)
             if month and latest is not None:
-                rows.append({
-                    "symbol": symbol,
-                    "name": name,
-                    "month": month,
-                    "price": latest,
-                    "volume": volume,
-                })
+                rows.append(Row(
+                    symbol=symbol,
+                    name=rec[i_name].strip(),
+                    month=month,
+                    price=latest,
+                    volume=to_int(rec[i_vol]) or 0,
+                ))
     return rows
 
 
-def filter_rows_for_bank(rows: list[dict], bank_code: str) -> list[dict]:
-    filters = [f.lower() for f in NAME_FILTERS.get(bank_code, [])]
-    return [r for r in rows if any(f in r["name"].lower() for f in filters)]
-
-
-def pick_one_per_month_max_volume(rows: list[dict]) -> list[dict]:
-    best = {}
-    for r in rows:
-        m = r["month"]
-        if m not in best or r["volume"] > best[m]["volume"]:
-            best[m] = r
-    return [best[m] for m in sorted(best.keys())]
-
+def load_csv_table(csv_path: Path) -> FuturesTable:
+    # Parse numérique vectorisé (fast_float) via Arrow au lieu de
+    # float()/int() par cellule. Les lignes hors-schéma (footer Barchart)
+    # sont ignorées, "N/A" devient null.
+    try:
+        # mmap + lecture en batchs: la mémoire pic reste O(taille de
+        # batch), seules les lignes valides sont accumulées
+        with pa.memory_map(str(csv_path)) as source:
+            reader = pacsv.open_csv(
+                source,
+                parse_options=pacsv.ParseOptions(
+                    invalid_row_handler=lambda _row: "skip",
+                ),
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=["Symbol", "Name", "Latest", "Volume"],
+                    column_types={"Latest": pa.float64(), "Volume": pa.int64()},
+                    null_values=["", "N/A", "unch"],
+                    strings_can_be_null=True,
+                ),
+            )
+            kept = []
+            for batch in reader:
+                tbl = pa.Table.from_batches([batch])
+                months_col = parse_months_arrow(tbl["Symbol"])
+                keep = pc.and_(
+                    pc.not_equal(months_col, ""),
+                    pc.is_valid(tbl["Latest"]),
+                )
+                kept.append(tbl.append_column("Month", months_col).filter(keep))
+    except (pa.ArrowInvalid, pa.ArrowKeyError):
+        return _table_from_rows(_load_csv_rows_python(csv_path))
+
+    if not kept:
+        return _table_from_rows([])
+
+    table = pa.concat_tables(kept)
+
+    # Trim en kernels Arrow; matérialisation NumPy en bout de chaîne
+    symbols_pa = pc.fill_null(pc.utf8_trim_whitespace(table["Symbol"]), "")
+    names_arrow = pc.fill_null(
+        pc.utf8_trim_whitespace(table["Name"]), ""
+    ).combine_chunks()
+
+    return FuturesTable(
+        symbols=symbols_pa.to_numpy(zero_copy_only=False).astype(str),
+        names=names_arrow.to_numpy(zero_copy_only=False).astype(str),
+        months=table["Month"].to_numpy(zero_copy_only=False).astype(str),
+        prices=table["Latest"].to_numpy(zero_copy_only=False).astype(np.float64),
+        volumes=np.nan_to_num(
+            table["Volume"].to_numpy(zero_copy_only=False)
+        ).astype(np.int64),
+        names_arrow=names_arrow,
+    )
+
+
+def load_csv_table_cached(csv_path: Path) -> FuturesTable:
+    """
+    Wrapper de load_csv_table avec sidecar Parquet keyé sur
+    (mtime_ns, size) du CSV: sur les runs à chaud (cron/CI), la table
+    normalisée est relue telle quelle au lieu de reparser le CSV.
+    """
+    try:
+        st = csv_path.stat()
+    except OSError:
+        return load_csv_table(csv_path)
+
+    cache_path = CACHE_DIR / f"{csv_path.stem}_{st.st_mtime_ns}_{st.st_size}.parquet"
+
+    if cache_path.exists():
+        try:
+            t = papq.read_table(cache_path)
+            names_arrow = t["name"].combine_chunks()
+            return FuturesTable(
+                symbols=t["symbol"].to_numpy(zero_copy_only=False).astype(str),
+                names=names_arrow.to_numpy(zero_copy_only=False).astype(str),
+                months=t["month"].to_numpy(zero_copy_only=False).astype(str),
+                prices=t["price"].to_numpy(zero_copy_only=False).astype(np.float64),
+                volumes=t["volume"].to_numpy(zero_copy_only=False).astype(np.int64),
+                names_arrow=names_arrow,
+            )
+        except (pa.ArrowInvalid, pa.ArrowKeyError, OSError):
+            pass  # cache corrompu -> reparse, il sera réécrit
+
+    table = load_csv_table(csv_path)
 
-def build_curve(picked: list[dict], price_formula: str) -> list[dict]:
-    curve = []
-    for r in picked:
-        rate = implied_rate_from_price(r["price"], price_formula)
-        curve.append({
-            "month": r["month"],
-            "rate": round(rate, 4),
-            "symbol": r["symbol"],
-            "price": r["price"],
-            "volume": r["volume"],
-            "name": r["name"],
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        papq.write_table(pa.table({
+            "symbol": table.symbols,
+            "name": table.names,
+            "month": table.months,
+            "price": table.prices,
+            "volume": table.volumes,
+        }), cache_path)
+        # purge des caches d'anciennes versions du même CSV
+        for old in CACHE_DIR.glob(f"{csv_path.stem}_*.parquet"):
+            if old != cache_path:
+                old.unlink(missing_ok=True)
+    except OSError:
+        pass  # cache best-effort: un échec d'écriture n'est pas bloquant
+
+    return table
+
+
+def filter_mask_for_bank(table: FuturesTable, bank_code: str) -> np.ndarray:
+    pattern = NAME_PATTERNS.get(bank_code)
+    if not pattern or len(table.names) == 0:
+        return np.zeros(len(table.names), dtype=bool)
+
+    names_arrow = table.names_arrow
+    if names_arrow is None:
+        names_arrow = pa.array(table.names)
+
+    mask = pc.match_substring_regex(names_arrow, pattern, ignore_case=True)
+    return mask.to_numpy(zero_copy_only=False)
+
+
+def classify_banks_by_name(table: FuturesTable) -> dict[str, np.ndarray]:
+    """
+    Classe chaque ligne dans sa banque en une seule passe regex sur la
+    colonne Name (groupes nommés), au lieu de 3 scans successifs.
+    Retourne un masque booléen par banque.
+    """
+    names_arrow = table.names_arrow
+    if names_arrow is None:
+        names_arrow = pa.array(table.names)
+
+    matches = pc.extract_regex(names_arrow, _COMBINED_NAME_PATTERN)
+    return {
+        bank: pc.fill_null(
+            pc.not_equal(pc.struct_field(matches, bank), ""), False
+        ).to_numpy(zero_copy_only=False)
+        for bank in NAME_FILTERS
+    }
+
+
+def pick_bank_indices_by_month(
+    table: FuturesTable,
+    bank_code: str,
+    mask: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Filtre banque + meilleur contrat (volume max) par mois, version
+    colonnes: lexsort (mois asc, volume desc) puis 1ère occurrence par
+    mois via np.unique. Remplace le dict best_by_month ligne à ligne.
+    Indices retournés triés par mois croissant.
+    """
+    if mask is None:
+        mask = filter_mask_for_bank(table, bank_code)
+    idx = np.flatnonzero(mask)
+    if idx.size == 0:
+        return idx
+
+    months = table.month_idx[idx]
+    volumes = table.volumes[idx]
+    # lexsort stable: à volume égal, la 1ère ligne du CSV gagne
+    # (tri sur les indices mois entiers, même ordre que les strings)
+    order = np.lexsort((-volumes, months))
+    _, first = np.unique(months[order], return_index=True)
+    return idx[order[first]]
+
+
+def build_curve(table: FuturesTable, picked: np.ndarray, price_formula: str) -> list[dict]:
+    prices = table.prices[picked]
+
+    if price_formula == "100_minus_rate":
+        rates = 100.0 - prices
+    elif price_formula == "rate_direct":
+        rates = prices
+    else:
+        raise ValueError("Unknown price_formula")
+
+    rates = np.round(rates, 4)
+
+    return [
+        {
+            "month": month,
+            "rate": rate,
+            "symbol": symbol,
+            "price": price,
+            "volume": volume,
+            "name": name,
             "synthetic": False,
-        })
-    return curve
+        }
+        for month, rate, symbol, price, volume, name in zip(
+            table.months[picked].tolist(),
+            rates.tolist(),
+            table.symbols[picked].tolist(),
+            prices.tolist(),
+            table.volumes[picked].tolist(),
+            table.names[picked].tolist(),
+        )
+    ]
 
 
-def strip_past_months(curve: list[dict]) -> list[dict]:
-    cutoff = now_month_utc()
-    return [p for p in curve if p["month"] >= cutoff]
+def strip_past_months(curve: list[dict], cutoff: str | None = None) -> list[dict]:
+    # La courbe sort de build_curve triée par mois: bisect + slice
+    # au lieu de re-tester chaque point
+    if cutoff is None:
+        cutoff = now_month_utc()
+    i = bisect_left(curve, cutoff, key=lambda p: p["month"])
+    return curve[i:]
 
 
 # -------------------------------------------------
@@ -161,37 +507,34 @@ def densify_monthly_linear(curve: list[dict]) -> list[dict]:
         return curve
 
     curve = sorted(curve, key=lambda x: x["month"])
-    idx_points = [(month_to_index(p["month"]), p) for p in curve]
-
-    out = {idx: p for idx, p in idx_points}
-
-    for i in range(len(idx_points) - 1):
-        idx0, p0 = idx_points[i]
-        idx1, p1 = idx_points[i + 1]
-        gap = idx1 - idx0
-
-        if gap <= 1:
-            continue
-
-        r0 = float(p0["rate"])
-        r1 = float(p1["rate"])
-
-        for k in range(1, gap):
-            idxk = idx0 + k
-            mk = index_to_month(idxk)
-            rk = r0 + (r1 - r0) * (k / gap)
-
-            out[idxk] = {
-                "month": mk,
-                "rate": round(rk, 4),
+    xs = months_to_indices(
+        np.asarray([p["month"] for p in curve], dtype=str)
+    ).astype(np.int64)
+    ys = np.array([float(p["rate"]) for p in curve])
+
+    # Interpolation linéaire vectorisée sur tous les mois manquants,
+    # au lieu de la double boucle Python par gap
+    full_x = np.arange(xs[0], xs[-1] + 1)
+    full_y = np.round(np.interp(full_x, xs, ys), 4)
+
+    known = {int(x): p for x, p in zip(xs, curve)}
+
+    out = []
+    for x, rate in zip(full_x.tolist(), full_y.tolist()):
+        p = known.get(x)
+        if p is not None:
+            out.append(p)
+        else:
+            out.append({
+                "month": index_to_month(x),
+                "rate": rate,
                 "symbol": "",
                 "price": None,
                 "volume": 0,
                 "name": "synthetic",
                 "synthetic": True,
-            }
-
-    return [out[i] for i in sorted(out.keys())]
+            })
+    return out
 
 
 # -------------------------------------------------
@@ -211,62 +554,122 @@ def compute_ecb_meeting_curve(monthly_curve: list[dict]) -> list[dict]:
     ]
 
     month_rates = {p["month"]: float(p["rate"]) for p in monthly_curve}
-    meeting_curve = []
-
-    for date_str in meeting_dates:
-        dt = datetime.strptime(date_str, "%Y-%m-%d")
-        month_key = f"{dt.year:04d}-{dt.month:02d}"
 
-        if month_key not in month_rates:
-            continue
-
-        monthly_rate = month_rates[month_key]
-        days_in_month = calendar.monthrange(dt.year, dt.month)[1]
+    # Contrairement à compute_after_meeting_curve, pas de récurrence ici:
+    # chaque réunion ne dépend que de son mois (et du suivant), donc tout
+    # le bloc arithmétique se calcule en colonnes d'un coup
+    kept = [d for d in meeting_dates if d[:7] in month_rates]
+    if not kept:
+        return []
+
+    months = [d[:7] for d in kept]
+
+    days = np.array([float(d[8:10]) for d in kept])
+    dim = np.array(
+        [float(_days_in_month(int(m[:4]), int(m[5:7]))) for m in months]
+    )
+    monthly = np.array([month_rates[m] for m in months])
+    nxt = np.array([
+        month_rates.get(index_to_month(month_to_index(m) + 1), month_rates[m])
+        for m in months
+    ])
+
+    weight_after = 1.0 - days / dim
+    rates_after = np.round((monthly + nxt) * weight_after, 4)
+
+    return [
+        {"meetingDate": d, "rateAfter": r, "month": m}
+        for d, r, m in zip(kept, rates_after.tolist(), months)
+    ]
 
-        weight_before = dt.day / days_in_month
-        weight_after = 1 - weight_before
 
-        next_month_key = index_to_month(month_to_index(month_key) + 1)
-        next_rate = month_rates.get(next_month_key, monthly_rate)
+# -------------------------------------------------
+# CORE
+# -------------------------------------------------
 
-        rate_after = (
-            monthly_rate * (1 - weight_before)
-            + next_rate * weight_after
-        )
+# TRADEBOARD_PRETTY=0 => JSON compact (~40% plus petit) pour les
+# sorties consommées uniquement par l'UI; indenté par défaut pour
+# garder des diffs lisibles sur les JSON versionnés
+_PRETTY = os.environ.get("TRADEBOARD_PRETTY", "1") not in ("0", "false", "no")
+if orjson is not None:
+    _JSON_OPTS = orjson.OPT_SERIALIZE_NUMPY
+    if _PRETTY:
+        _JSON_OPTS |= orjson.OPT_INDENT_2
 
-        meeting_curve.append({
-            "meetingDate": date_str,
-            "rateAfter": round(rate_after, 4),
-            "month": month_key,
-        })
+# Le format de sortie fait partie des entrées du stamp: passer en mode
+# compact (ou perdre orjson) doit invalider les JSON déjà écrits
+_FORMAT_TAG = f"|fmt:{int(_PRETTY)}:{int(orjson is not None)}".encode()
 
-    return meeting_curve
 
+def _dumps_sorted(obj) -> bytes:
+    """Sérialisation canonique (clés triées), pour les stamps."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    # default=str: les valeurs YAML non JSON (dates ISO non quotées)
+    # doivent hasher au lieu de lever, comme avec orjson
+    return json.dumps(obj, sort_keys=True, default=str).encode()
 
-# -------------------------------------------------
-# CORE
-# -------------------------------------------------
 
 def write_json(path: Path, data):
+    # orjson: sérialisation native (floats inclus), accepte aussi les
+    # types NumPy issus du pipeline colonnes sans conversion préalable
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=_JSON_OPTS))
+    else:
+        path.write_text(
+            json.dumps(
+                data,
+                indent=2 if _PRETTY else None,
+                separators=None if _PRETTY else (",", ":"),
+            ),
+            encoding="utf-8",
+        )
 
 
-def run_bank(bank_code: str, all_rows: list[dict]):
+def run_bank(
+    bank_code: str,
+    table: FuturesTable,
+    cutoff: str | None = None,
+    mask: np.ndarray | None = None,
+    input_digest: bytes | None = None,
+):
 
     cfg = load_config(bank_code)
     current_rate = float(cfg["current_rate"]["value"])
     price_formula = cfg.get("futures", {}).get("price_formula", "100_minus_rate")
 
-    filtered = filter_rows_for_bank(all_rows, bank_code)
-
-    if not filtered:
+    out_curve_path = OUT_DIR / f"{bank_code.lower()}_implied_curve.json"
+    out_meetings_path = OUT_DIR / f"{bank_code.lower()}_implied_meetings.json"
+    stamp_path = OUT_DIR / f".{bank_code.lower()}.stamp"
+
+    # Run déterministe en (CSV, config, mois courant): si rien n'a
+    # changé depuis le dernier run, les sorties sont déjà bonnes
+    stamp = None
+    if input_digest is not None:
+        stamp = hashlib.blake2b(
+            input_digest + _dumps_sorted(cfg) + (cutoff or "").encode()
+            + _FORMAT_TAG,
+            digest_size=16,
+        ).hexdigest()
+        try:
+            if (
+                stamp_path.read_text() == stamp
+                and out_curve_path.exists()
+                and out_meetings_path.exists()
+            ):
+                return
+        except OSError:
+            pass
+
+    picked = pick_bank_indices_by_month(table, bank_code, mask)
+
+    if picked.size == 0:
         curve = []
         meetings_curve = []
     else:
-        picked = pick_one_per_month_max_volume(filtered)
-        curve = build_curve(picked, price_formula)
-        curve = strip_past_months(curve)
+        curve = build_curve(table, picked, price_formula)
+        curve = strip_past_months(curve, cutoff)
 
         if bank_code == "ECB":
             curve = densify_monthly_linear(curve)
@@ -274,8 +677,14 @@ def run_bank(bank_code: str, all_rows: list[dict]):
         else:
             meetings_curve = []
 
-    write_json(OUT_DIR / f"{bank_code.lower()}_implied_curve.json", curve)
-    write_json(OUT_DIR / f"{bank_code.lower()}_implied_meetings.json", meetings_curve)
+    write_json(out_curve_path, curve)
+    write_json(out_meetings_path, meetings_curve)
+
+    if stamp is not None:
+        try:
+            stamp_path.write_text(stamp)
+        except OSError:
+            pass  # stamp best-effort: au pire on recalcule au prochain run
 
 
 def main():
@@ -283,10 +692,28 @@ def main():
     if not CSV_PATH.exists():
         raise FileNotFoundError("CSV not found")
 
-    all_rows = load_csv_rows(CSV_PATH)
+    table = load_csv_table_cached(CSV_PATH)
+    cutoff = now_month_utc()  # une seule lecture de l'horloge par run
+    bank_masks = classify_banks_by_name(table)
 
-    for code in ["FED", "ECB", "BOE"]:
-        run_bank(code, all_rows)
+    try:
+        csv_digest = hashlib.blake2b(
+            CSV_PATH.read_bytes(), digest_size=16
+        ).digest()
+    except OSError:
+        csv_digest = None
+
+    codes = ["FED", "ECB", "BOE"]
+    # Banques indépendantes (table partagée en lecture seule):
+    # un thread par banque, les kernels Arrow/NumPy et les écritures
+    # JSON relâchent le GIL
+    with ThreadPoolExecutor(max_workers=len(codes)) as ex:
+        list(ex.map(
+            lambda code: run_bank(
+                code, table, cutoff, bank_masks.get(code), csv_digest
+            ),
+            codes,
+        ))
 
 
 if __name__ == "__main__":
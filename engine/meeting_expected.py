@@ -3,16 +3,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, asdict
-from datetime import date
-import calendar
+from functools import lru_cache
 from typing import List, Dict, Any
 
+import numpy as np
+
 
 # ============================================================
 # 📌 Modèle : 1 point = 1 réunion (comme Financial Source)
 # ============================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MeetingPoint:
     meetingDate: str      # "YYYY-MM-DD"
     month: str            # "YYYY-MM"
@@ -37,8 +38,16 @@ class MeetingPoint:
 # Utils dates
 # ============================================================
 
+# Jours par mois (année non bissextile); février est corrigé à la volée
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
 def _days_in_month(y: int, m: int) -> int:
-    return calendar.monthrange(y, m)[1]
+    # Table + test bissextile inline: pas de tuple alloué ni de calcul
+    # calendar.monthrange par réunion
+    if m == 2 and y % 4 == 0 and (y % 100 != 0 or y % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[m - 1]
 
 
 def _ym_from_date_str(d: str) -> str:
@@ -46,33 +55,17 @@ def _ym_from_date_str(d: str) -> str:
     return d[:7]
 
 
-def _parse_ym(ym: str) -> tuple[int, int]:
-    return int(ym[:4]), int(ym[5:7])
-
-
-def _parse_date(d: str) -> date:
-    return date(int(d[:4]), int(d[5:7]), int(d[8:10]))
-
-
 def _round_to_increment(rate: float, increment_bp: int) -> float:
     """
     Arrondit un taux (%) à l’incrément officiel (ex: 25 bps = 0.25%)
     """
-    step = increment_bp / 100.0
-    if step <= 0:
+    if increment_bp <= 0:
         return rate
-    return round(round(rate / step) * step, 6)
-
-
-def _pick_next_available_month(target_ym: str, available_months_sorted: List[str]) -> str | None:
-    """
-    Fallback: si target_ym n'existe pas, retourne le 1er mois dispo >= target_ym.
-    Ex: target=2026-04, dispo=[2026-02,2026-03,2026-05,...] -> 2026-05
-    """
-    for m in available_months_sorted:
-        if m >= target_ym:
-            return m
-    return None
+    # Passage par les points de base ENTIERS: n * increment_bp est exact,
+    # et l'unique division finale par 100 arrondit une seule fois —
+    # plus besoin du round(..., 6) de normalisation
+    step = increment_bp / 100.0
+    return round(rate / step) * increment_bp / 100.0
 
 
 # ============================================================
@@ -98,48 +91,73 @@ def compute_after_meeting_curve(
         on prend le 1er mois disponible APRÈS (>=) pour approximer.
     """
 
-    # Index mois -> taux mensuel (%)
-    month_to_rate: Dict[str, float] = {}
-    for p in monthly_curve:
-        m = p.get("month")
-        r = p.get("rate")
-        if isinstance(m, str) and isinstance(r, (int, float)):
-            month_to_rate[m] = float(r)
+    # Index mois -> taux mensuel (%).
+    # Schéma garanti en amont par build_curve/densify (month: str,
+    # rate: float) -> comprehension C directe, pas de double isinstance
+    # par point
+    month_to_rate: Dict[str, float] = {
+        p["month"]: float(p["rate"]) for p in monthly_curve
+    }
 
     available_months_sorted = sorted(month_to_rate.keys())
 
-    # Meetings triées chronologiquement
+    # Meetings triées chronologiquement (ISO => tri lexicographique ok)
     meeting_dates_sorted = sorted(
-        [d for d in meeting_dates if isinstance(d, str) and len(d) >= 10]
+        d for d in meeting_dates if isinstance(d, str) and len(d) >= 10
+    )
+
+    if not meeting_dates_sorted or not month_to_rate:
+        return []
+
+    # SoA: dates parsées et pondérations calculées en colonnes UNE fois;
+    # la boucle ne garde que la récurrence (l'arrondi réinjecté dans
+    # prev_after_rate interdit la forme fermée vectorielle)
+    yms = [_ym_from_date_str(d) for d in meeting_dates_sorted]
+    days_before_arr = np.array(
+        [float(d[8:10]) for d in meeting_dates_sorted]
+    ) - 1.0
+    dim_arr = np.array(
+        [float(_days_in_month(int(m[:4]), int(m[5:7]))) for m in yms]
     )
+    w_before_list = (days_before_arr / dim_arr).tolist()
+    w_after_list = (1.0 - days_before_arr / dim_arr).tolist()
+
+    # Résolution des mois en UN searchsorted batché ("YYYY-MM" trie
+    # lexicographiquement): side="left" retombe sur le mois exact s'il
+    # existe, sinon sur le 1er mois dispo >= (même fallback qu'avant)
+    months_arr = np.array(available_months_sorted)
+    rate_idx = np.searchsorted(months_arr, np.array(yms), side="left").tolist()
+
+    # Taux alignés sur available_months_sorted: lecture indexée directe
+    # dans la boucle au lieu d'un hash/compare de clé string par meeting
+    rates_list = [month_to_rate[m] for m in available_months_sorted]
+
+    # Snap à l'incrément hoisté hors boucle: step et le test <=0 sont
+    # calculés une fois, l'arrondi reste round() (banker's) — la variante
+    # rate*inv_step changerait les bits près des demi-pas
+    step = increment_bp / 100.0 if increment_bp > 0 else 0.0
 
     out: List[Dict[str, Any]] = []
 
     # Taux "avant réunion" = dernier taux après réunion connue
     prev_after_rate = float(current_rate)
 
-    for d in meeting_dates_sorted:
-        ym_meeting = _ym_from_date_str(d)
+    n_months = len(available_months_sorted)
 
-        # ✅ pick month rate (direct si dispo, sinon fallback mois suivant)
-        ym_rate = ym_meeting if ym_meeting in month_to_rate else _pick_next_available_month(
-            ym_meeting, available_months_sorted
-        )
+    for i, d in enumerate(meeting_dates_sorted):
+        ym_meeting = yms[i]
 
+        # ✅ pick month rate (direct si dispo, sinon fallback mois suivant)
         # Si aucun mois dispo après → skip
-        if ym_rate is None:
+        j = rate_idx[i]
+        if j >= n_months:
             continue
 
-        meeting_dt = _parse_date(d)
-        y, m = _parse_ym(ym_meeting)  # pondération basée sur le MOIS du meeting
-        dim = _days_in_month(y, m)
-
-        # Pondérations temporelles
-        days_before = meeting_dt.day - 1
-        w_before = days_before / dim
-        w_after = 1.0 - w_before
+        # Pondérations temporelles (précalculées en colonnes)
+        w_before = w_before_list[i]
+        w_after = w_after_list[i]
 
-        r_month = month_to_rate[ym_rate]
+        r_month = rates_list[j]
 
         # Sécurité : meeting le dernier jour du mois
         if w_after <= 1e-9:
@@ -147,27 +165,66 @@ def compute_after_meeting_curve(
         else:
             r_after_raw = (r_month - (w_before * prev_after_rate)) / w_after
 
-        # Arrondi à l’incrément officiel
-        r_after = _round_to_increment(r_after_raw, increment_bp)
+        # Arrondi à l’incrément officiel (version inline de
+        # _round_to_increment, step précalculé)
+        if step:
+            r_after = round(r_after_raw / step) * increment_bp / 100.0
+        else:
+            r_after = r_after_raw
 
         # 🔹 MOVE en bps (diff vs taux précédent)
         move_raw_bps = (r_after_raw - prev_after_rate) * 100.0
         move_after_bps = (r_after - prev_after_rate) * 100.0
 
-        mp = MeetingPoint(
-            meetingDate=d,
-            month=ym_meeting,  # ⚠️ on garde le mois du meeting (UI), même si on a pris ym_rate en fallback
-            rateAfter=round(r_after, 6),
-            rateRaw=round(float(r_after_raw), 6),
-            moveAfterBps=round(move_after_bps, 2),
-            moveRawBps=round(move_raw_bps, 4),
-            weightBefore=round(w_before, 6),
-            weightAfter=round(w_after, 6),
-        )
-
-        out.append(mp.to_dict())
+        # Dict littéral direct (mêmes champs que MeetingPoint): pas
+        # d'allocation dataclass + introspection asdict par meeting
+        out.append({
+            "meetingDate": d,
+            "month": ym_meeting,  # ⚠️ on garde le mois du meeting (UI), même si on a pris ym_rate en fallback
+            "rateAfter": round(r_after, 6),
+            "rateRaw": round(float(r_after_raw), 6),
+            "moveAfterBps": round(move_after_bps, 2),
+            "moveRawBps": round(move_raw_bps, 4),
+            "weightBefore": round(w_before, 6),
+            "weightAfter": round(w_after, 6),
+        })
 
         # Le taux "après" devient le taux "avant" du meeting suivant
         prev_after_rate = float(r_after)
 
     return out
+
+
+@lru_cache(maxsize=64)
+def _after_meeting_curve_cached(
+    curve_key: tuple,
+    meetings_key: tuple,
+    current_rate: float,
+    increment_bp: int,
+) -> List[Dict[str, Any]]:
+    return compute_after_meeting_curve(
+        [{"month": m, "rate": r} for m, r in curve_key],
+        list(meetings_key),
+        current_rate,
+        increment_bp,
+    )
+
+
+def compute_after_meeting_curve_cached(
+    monthly_curve: List[Dict[str, Any]],
+    meeting_dates: List[str],
+    current_rate: float,
+    increment_bp: int = 25,
+) -> List[Dict[str, Any]]:
+    """
+    Variante mémoïsée pour le mode service (recalcul par tick):
+    tant que (courbe, meetings, taux courant, incrément) ne bougent pas,
+    la courbe par réunion sort du cache au lieu d'être recalculée.
+    """
+    curve_key = tuple((p["month"], p["rate"]) for p in monthly_curve)
+    cached = _after_meeting_curve_cached(
+        curve_key, tuple(meeting_dates), float(current_rate), int(increment_bp)
+    )
+    # Copies superficielles: l'entrée mémoïsée reste à l'abri des
+    # mutations du caller
+    return [dict(p) for p in cached]
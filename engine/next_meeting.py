@@ -10,21 +10,12 @@ def _step_from_increment(increment_bp: int) -> float:
     return float(increment_bp) / 100.0
 
 
-def _clamp(x: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, x))
-
-
-def _floor_to_step(x: float, step: float) -> float:
-    # ex: x=3.37 step=0.25 -> 3.25
-    return (int(x / step)) * step
-
-
 def compute_distribution_from_expected(
     expected_rate: float,
     increment_bp: int,
     min_rate: float,
     max_rate: float,
-) -> Dict[float, float]:
+) -> Tuple[float, float, float, float]:
     """
     Distribution la plus simple + robuste:
     on projette l'expected sur la grille (0.25%, 0.50%, ...)
@@ -34,14 +25,20 @@ def compute_distribution_from_expected(
       expected=3.37, step=0.25 -> entre 3.25 et 3.50
       p(3.50)= (3.37-3.25)/0.25 = 0.48
       p(3.25)= 0.52
+
+    Retourne le tuple (lo, p_lo, hi, p_hi) — pas de dict alloué/hashé
+    par tick; hi == lo signale une distribution à un seul niveau.
+    Le dict n'est reconstruit qu'à la frontière JSON.
     """
     step = _step_from_increment(increment_bp)
     if step <= 0:
-        return {expected_rate: 1.0}
+        return (expected_rate, 1.0, expected_rate, 0.0)
 
-    expected_rate = _clamp(float(expected_rate), float(min_rate), float(max_rate))
+    # clamp + floor-to-step inline: ces micro-helpers coûtaient plus
+    # en frames d'appel qu'en corps (appelés à chaque tick)
+    expected_rate = max(float(min_rate), min(float(max_rate), float(expected_rate)))
 
-    lo = _floor_to_step(expected_rate, step)
+    lo = int(expected_rate / step) * step  # ex: 3.37, step 0.25 -> 3.25
     hi = lo + step
 
     # si on dépasse max_rate
@@ -50,37 +47,45 @@ def compute_distribution_from_expected(
 
     # si expected tombe pile sur un niveau
     if abs(expected_rate - lo) < 1e-12 or hi == lo:
-        return {round(lo, 6): 1.0}
+        lo = round(lo, 6)
+        return (lo, 1.0, lo, 0.0)
 
     p_hi = (expected_rate - lo) / step
     p_lo = 1.0 - p_hi
 
-    return {
-        round(lo, 6): round(p_lo, 6),
-        round(hi, 6): round(p_hi, 6),
-    }
+    return (round(lo, 6), round(p_lo, 6), round(hi, 6), round(p_hi, 6))
+
+
+def distribution_to_dict(dist: Tuple[float, float, float, float]) -> Dict[float, float]:
+    """Matérialise le tuple (lo, p_lo, hi, p_hi) en dict pour le JSON."""
+    lo, p_lo, hi, p_hi = dist
+    if hi == lo:
+        return {lo: p_lo}
+    return {lo: p_lo, hi: p_hi}
 
 
 def probs_cut_hold_hike(
-    dist: Dict[float, float],
+    dist: Tuple[float, float, float, float],
     current_rate: float,
     increment_bp: int,
 ) -> Dict[str, float]:
     """
-    Agrège une distribution de taux en 3 buckets:
+    Agrège une distribution (lo, p_lo, hi, p_hi) en 3 buckets:
     - Cut  : taux < current
     - Hold : taux == current (sur la grille)
     - Hike : taux > current
     """
     step = _step_from_increment(increment_bp)
     # On aligne current sur la grille (si jamais il est "bizarre")
-    cur = round(_floor_to_step(float(current_rate) + 1e-12, step), 6)
+    cur = round(int((float(current_rate) + 1e-12) / step) * step, 6)
 
     p_cut = 0.0
     p_hold = 0.0
     p_hike = 0.0
 
-    for level, p in dist.items():
+    lo, p_lo, hi, p_hi = dist
+    pairs = ((lo, p_lo),) if hi == lo else ((lo, p_lo), (hi, p_hi))
+    for level, p in pairs:
         if level < cur - 1e-12:
             p_cut += p
         elif level > cur + 1e-12:
@@ -96,17 +101,30 @@ def probs_cut_hold_hike(
     }
 
 
-def top_two_scenarios(dist: Dict[float, float]) -> Tuple[Dict[str, Any] | None, Dict[str, Any] | None]:
+def top_two_scenarios(
+    dist: Tuple[float, float, float, float],
+) -> Tuple[Dict[str, Any] | None, Dict[str, Any] | None]:
     """
     Renvoie 2 scénarios: le niveau le plus probable + le second.
     """
     if not dist:
         return None, None
 
-    items = sorted(dist.items(), key=lambda kv: kv[1], reverse=True)
-    s1 = {"rate": items[0][0], "prob": round(items[0][1], 6)}
-    s2 = {"rate": items[1][0], "prob": round(items[1][1], 6)} if len(items) > 1 else None
-    return s1, s2
+    lo, p_lo, hi, p_hi = dist
+    if hi == lo:
+        return {"rate": lo, "prob": round(p_lo, 6)}, None
+
+    # À égalité, lo garde la 1ère place (même ordre que le tri stable
+    # sur l'ancien dict)
+    if p_hi > p_lo:
+        return (
+            {"rate": hi, "prob": round(p_hi, 6)},
+            {"rate": lo, "prob": round(p_lo, 6)},
+        )
+    return (
+        {"rate": lo, "prob": round(p_lo, 6)},
+        {"rate": hi, "prob": round(p_hi, 6)},
+    )
 
 
 def build_next_meeting_summary(
@@ -146,8 +164,22 @@ def build_next_meeting_summary(
         max_rate=max_rate,
     )
 
-    probs = probs_cut_hold_hike(dist, current_rate=current_rate, increment_bp=increment_bp)
-    s1, s2 = top_two_scenarios(dist)
+    # Raccourci du cas courant "rien ne bouge": distribution à un seul
+    # niveau collé au taux courant sur la grille -> buckets et scénarios
+    # connus d'avance, on saute probs_cut_hold_hike + top_two_scenarios
+    lo, p_lo, hi, _ = dist
+    step = _step_from_increment(increment_bp)
+    if (
+        step > 0
+        and hi == lo
+        and abs(lo - round(int((current_rate + 1e-12) / step) * step, 6)) <= 1e-12
+    ):
+        p = round(p_lo, 6)
+        probs = {"cut": 0.0, "hold": p, "hike": 0.0}
+        s1, s2 = {"rate": lo, "prob": p}, None
+    else:
+        probs = probs_cut_hold_hike(dist, current_rate=current_rate, increment_bp=increment_bp)
+        s1, s2 = top_two_scenarios(dist)
 
     return {
         "meetingDate": meeting_date,
@@ -155,7 +187,7 @@ def build_next_meeting_summary(
         "currentRate": round(current_rate, 6),
         "expectedRateAfterRaw": round(expected_after_raw, 6),
         "expectedMoveBps": round(expected_move_bps, 2),
-        "distribution": dist,   # utile debug/UI
+        "distribution": distribution_to_dict(dist),   # utile debug/UI
         "probabilities": probs, # cut/hold/hike
         "mainScenario": s1,
         "altScenario": s2,
@@ -1,8 +1,6 @@
 # engine/symbols.py
 from __future__ import annotations
 
-import re
-
 # Codes mois (futures) -> numéro de mois
 _MONTH_CODE = {
     "F": 1,  # Jan
@@ -19,20 +17,19 @@ _MONTH_CODE = {
     "Z": 12, # Dec
 }
 
-_SYMBOL_RE = re.compile(r"^ZQ([FGHJKMNQUVXZ])(\d{2})$")
+# Univers complet des symboles valides (12 lettres x 100 années 2000-2099
+# = 1200 entrées): tout le parsing est payé UNE fois à l'import, l'appel
+# se réduit à un hash lookup
+_SYMBOL_TABLE = {
+    f"ZQ{code}{yy:02d}": f"{2000 + yy:04d}-{month:02d}"
+    for code, month in _MONTH_CODE.items()
+    for yy in range(100)
+}
+
 
 def fed_funds_symbol_to_month(symbol: str) -> str | None:
     """
     Convertit un symbol CME 30-Day Fed Funds type ZQX25 en 'YYYY-MM'.
     Retourne None si le format n'est pas reconnu.
     """
-    s = (symbol or "").strip().upper()
-    m = _SYMBOL_RE.match(s)
-    if not m:
-        return None
-
-    month_code = m.group(1)
-    yy = int(m.group(2))
-    year = 2000 + yy
-    month = _MONTH_CODE[month_code]
-    return f"{year:04d}-{month:02d}"
+    return _SYMBOL_TABLE.get((symbol or "").strip().upper())